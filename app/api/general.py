@@ -1,8 +1,11 @@
-from fastapi import APIRouter, HTTPException, Body, Path
+from fastapi import APIRouter, HTTPException, Body, Path, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import Type, Dict
 from pydantic import BaseModel
-from services.cmq import Cmq
-from models.general_models import type_model_map
+import numpy
+from services.cmq import Cmq, batch_models
+from services.ndjson_stream import NDJSON_MEDIA_TYPE, stream_rows
+from models.general_models import type_model_map, CmqBatchInput, CmqMemberInput, CmqStreamRow
 
 # ルーターの作成
 router = APIRouter()
@@ -11,6 +14,171 @@ router = APIRouter()
 cmq = Cmq()
 
 
+# /cmq/{type_model} より先に登録する (パスが一致してしまうため)
+@router.post("/cmq/batch")
+def cmq_batch_culc(input_data: CmqBatchInput):
+    """
+    複数のCMQ計算を一括で行うエンドポイント。<br /><br />
+
+    ### 概要:
+    行ごとの計算モデルと入力値を列形式の配列で受け取り、全行をまとめて配列演算で計算します。
+    結果も列形式 (Ci, Cj, M0, Qi, Qj の配列) で、入力と同じ行の順に返します。
+
+    ### ボディパラメータ:
+    - **type_model**: 各行の計算モデルの種類。例: `type_point`, `type_zone`など。
+    - **al**: 各行の部材長。
+    - **a, b, w, wl, p, awl, bwl**: 各行の入力値。省略した項目は0として扱います。
+      各モデルで使用する項目は `/cmq/{type_model}` の入力と同じです。
+
+    ### エラーレスポンス:
+    - **400 Bad Request**: 無効な `type_model`、配列の長さの不一致、部材長の誤りがある場合。
+    """
+    n = len(input_data.type_model)
+    columns = {}
+    for name in ("al", "a", "b", "w", "wl", "p", "awl", "bwl"):
+        values = getattr(input_data, name)
+        if values is None:
+            columns[name] = 0.0
+        elif len(values) != n:
+            raise HTTPException(status_code=400, detail=f"Invalid input: length of '{name}' must be {n}")
+        else:
+            columns[name] = numpy.asarray(values, dtype=float)
+
+    model = numpy.asarray(input_data.type_model)
+    invalid = numpy.flatnonzero(~numpy.isin(model, batch_models))
+    if invalid.size:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid type_model provided at rows {invalid[:10].tolist()}"
+        )
+    invalid = numpy.flatnonzero(columns["al"] < 0.01)
+    if invalid.size:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid input: al must be >= 0.01 at rows {invalid[:10].tolist()}"
+        )
+
+    # 全行をまとめて計算し、結果を整形
+    result = cmq.batch_form(cmq.cmq_batch(model, **columns), n=2)
+
+    # 行数が多いため jsonable_encoder を経由せずにそのままJSONに変換して返却
+    return JSONResponse(
+        content={
+            "count": n,
+            "cmq_result": {
+                "Ci": result[:, 0].tolist(),  # 部材の左端せん断力
+                "Cj": result[:, 1].tolist(),  # 部材の右端せん断力
+                "M0": result[:, 2].tolist(),  # 部材の中央における曲げモーメント
+                "Qi": result[:, 3].tolist(),  # 左端におけるせん断力
+                "Qj": result[:, 4].tolist(),  # 右端におけるせん断力
+            },
+        }
+    )
+
+
+def cmq_stream_chunk(rows):
+    # NDJSON ストリーミングの1チャンク分 (CmqStreamRow のリスト) をまとめて計算
+    result = [None] * len(rows)
+    valid = []
+    for i, row in enumerate(rows):
+        if row.type_model not in batch_models:
+            result[i] = {"error": f"Invalid type_model: {row.type_model}"}
+        elif row.al < 0.01:
+            result[i] = {"error": "Invalid input: al must be >= 0.01"}
+        else:
+            valid.append(i)
+
+    if valid:
+        columns = {
+            name: numpy.array([getattr(rows[i], name) for i in valid], dtype=float)
+            for name in ("al", "a", "b", "w", "wl", "p", "awl", "bwl")
+        }
+        model = numpy.array([rows[i].type_model for i in valid])
+        values = cmq.batch_form(cmq.cmq_batch(model, **columns), n=2).tolist()
+        for i, (ci, cj, m0, qi, qj) in zip(valid, values):
+            result[i] = {"Ci": ci, "Cj": cj, "M0": m0, "Qi": qi, "Qj": qj}
+    return result
+
+
+# /cmq/{type_model} より先に登録する (パスが一致してしまうため)
+@router.post(
+    "/cmq/stream",
+    openapi_extra={
+        "requestBody": {
+            "content": {NDJSON_MEDIA_TYPE: {"schema": CmqStreamRow.model_json_schema()}},
+            "required": True,
+        }
+    },
+)
+async def cmq_stream_culc(request: Request):
+    """
+    大量のCMQ計算を NDJSON (1行に1件のJSON) で受け取り、計算結果を NDJSON で順次返すエンドポイント。<br /><br />
+
+    ### 概要:
+    リクエストボディを受信した分から1行ずつ読み取り、一定の行数ごとにまとめて配列演算で計算して返します。
+    全行の受信を待たずに最初の結果から返すため、行数が多くてもメモリ使用量は増えません。
+
+    ### ボディ (1行分):
+    - **type_model**: 計算モデルの種類。例: `type_point`, `type_zone`など。
+    - **al**: 部材長。
+    - **a, b, w, wl, p, awl, bwl**: 入力値。省略した項目は0として扱います。
+
+    ### レスポンス (1行分):
+    - `{"index": 行番号, "Ci", "Cj", "M0", "Qi", "Qj"}`。
+      入力に誤りがある行は `{"index": 行番号, "error": 内容}` を返します。
+    """
+    return StreamingResponse(stream_rows(request, CmqStreamRow, cmq_stream_chunk), media_type=NDJSON_MEDIA_TYPE)
+
+
+# /cmq/{type_model} より先に登録する (パスが一致してしまうため)
+@router.post("/cmq/member")
+def cmq_member_culc(input_data: CmqMemberInput):
+    """
+    1つの部材に作用する複数の荷重によるCMQを重ね合わせて計算するエンドポイント。<br /><br />
+
+    ### 概要:
+    集中荷重・分布荷重・三角形荷重などの種類の異なる荷重をまとめて計算して合計し、
+    `q_fix` が 1 の場合は合計値に対して両端固定梁のせん断力への変換を1回だけ行います。
+
+    ### ボディパラメータ:
+    - **al**: 部材長。
+    - **q_fix**: 0: 両端ピンのせん断力, 1: 両端固定のせん断力。
+    - **loads**: 荷重のリスト。各荷重は `type_model` と `/cmq/{type_model}` と同じ入力値を持ちます。
+
+    ### レスポンス:
+    - 重ね合わせたCMQ計算結果を返します。
+
+    ### エラーレスポンス:
+    - **400 Bad Request**: 無効な `type_model` もしくは部材長が不正な場合。
+    """
+    if input_data.al < 0.01:
+        raise HTTPException(status_code=400, detail="Invalid input: al must be >= 0.01")
+    loads = input_data.loads
+    invalid = [i for i, load in enumerate(loads) if load.type_model not in batch_models]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Invalid type_model provided at loads {invalid[:10]}")
+
+    # 荷重の入力値を列ごとの配列にまとめて一括で計算
+    columns = {
+        name: numpy.array([getattr(load, name) or 0.0 for load in loads], dtype=float)
+        for name in ("a", "b", "w", "wl", "p", "awl", "bwl")
+    }
+    member_cmq = Cmq(q_fix=input_data.q_fix)
+    result = member_cmq.cmq_loads(input_data.al, [load.type_model for load in loads], **columns)
+
+    # 結果を整形して返却
+    cmq_result = member_cmq.cmq_form(result, n=2)
+
+    return {
+        "input_data": input_data.model_dump(),
+        "cmq_result": {
+            "Ci": cmq_result[0],  # 部材の左端せん断力
+            "Cj": cmq_result[1],  # 部材の右端せん断力
+            "M0": cmq_result[2],  # 部材の中央における曲げモーメント
+            "Qi": cmq_result[3],  # 左端におけるせん断力
+            "Qj": cmq_result[4],  # 右端におけるせん断力
+        },
+    }
+
+
 @router.post("/cmq/{type_model}")
 async def cmq_culc(
     type_model: str = Path(
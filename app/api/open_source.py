@@ -1,9 +1,86 @@
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from typing import List
 from services.steel import Steel
 import logging
 
 router = APIRouter()
 
+# 断面性能の名称と get_section で取得される values の位置
+section_value_index = {"A": 0, "Ix": 1, "Iy": 2, "Zx": 3, "Zy": 4, "ix": 5, "iy": 6, "Cy": 7}
+
+# 複数断面の一括取得で指定できる断面の最大数
+MAX_MULTI_SECTIONS = 1000
+
+
+# 複数の断面の複数の断面性能を1回のリクエストで取得する
+@router.get("/get_section/excel/multi")
+def get_sections_excel(
+    sizes: List[str] = Query(
+        ...,
+        description="部材寸法 (カンマ区切りまたは複数指定)。例: H-300*150*6.5*9,BOX-150*6",
+    ),
+    values: List[str] = Query(
+        ["A", "Ix", "Iy", "Zx", "Zy", "ix", "iy", "Cy"],
+        description="出力したい値 (カンマ区切りまたは複数指定)。A, Ix, Iy, Zx, Zy, ix, iy, Cy",
+    ),
+    format: str = Query("csv", description="出力形式 (csv, tsv, json)"),
+    header: bool = Query(False, description="csv, tsv の場合に1行目に見出しを出力するか"),
+):
+    """
+    複数の部材寸法について、指定された複数の値をまとめて出力します。
+
+    ExcelのWEBSERVICE関数などから1回の呼び出しで表全体を取得するためのものです。
+    行は `sizes` の順、列は `values` の順に並びます。
+    一致する断面がない場合や、その形状にない値 (BOX, PIPE の Cy など) は csv, tsv では `N/A`、json では `null` になります。
+
+    Args:
+        sizes (List[str]): 部材寸法のリスト
+        values (List[str]): 出力したい値のリスト ("A", "Ix", "Iy", "Zx", "Zy", "ix", "iy", "Cy")
+        format (str): 出力形式 ("csv", "tsv", "json")
+        header (bool): csv, tsv の1行目に見出しを出力するか
+
+    Example:
+        `/get_section/excel/multi?sizes=H-300*150*6.5*9,BOX-150*6&values=A,Ix,Zx` ->
+        2行3列のcsvを返します。
+
+    Returns:
+        csv, tsv の場合は表形式の文字列、json の場合は見出し (columns) と値の行列 (rows) を返します。
+    """
+    size_list = [size.strip() for item in sizes for size in item.split(",") if size.strip()]
+    value_list = [value.strip() for item in values for value in item.split(",") if value.strip()]
+    logging.debug(f"Getting section data for sizes: {size_list} and values: {value_list}")
+
+    if not size_list or len(size_list) > MAX_MULTI_SECTIONS:
+        raise HTTPException(
+            status_code=400, detail=f"部材寸法は1〜{MAX_MULTI_SECTIONS}個の範囲で指定してください"
+        )
+    invalid = [value for value in value_list if value not in section_value_index]
+    if not value_list or invalid:
+        raise HTTPException(status_code=400, detail=f"無効な値が指定されました: {invalid}")
+    if format not in ("csv", "tsv", "json"):
+        raise HTTPException(status_code=400, detail="無効な出力形式が指定されました")
+
+    steel = Steel()
+
+    rows = []
+    for size in size_list:
+        shape, section, props = steel.get_section(size)
+        row = []
+        for value in value_list:
+            i = section_value_index[value]
+            row.append(props[i] if props is not None and len(props) > i else None)
+        rows.append(row)
+
+    if format == "json":
+        return {"columns": value_list, "sizes": size_list, "rows": rows}
+
+    sep = "," if format == "csv" else "\t"
+    lines = [sep.join(value_list)] if header else []
+    lines += [sep.join("N/A" if v is None else str(v) for v in row) for row in rows]
+    media_type = "text/csv" if format == "csv" else "text/tab-separated-values"
+    return PlainTextResponse("\n".join(lines), media_type=media_type)
+
 
 # H形鋼の断面性能をパスパラメータで取得する
 @router.get("/get_section/excel/h/{value}")
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException
-from models.rc_input_models import RcGetSectionInput
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from models.rc_input_models import RcGetSectionInput, RcBeamInput, RcColumnInput
 from services.rcbeam import RCBeam
 from services.rccolumn import RCColumn
+from services.ndjson_stream import NDJSON_MEDIA_TYPE, stream_rows
 
 
 # ルーターの作成
@@ -11,3 +13,86 @@ router = APIRouter()
 @router.get("/")
 async def route_name():
     return {"message": "Hello World"}
+
+
+def rc_stream_chunk(cls, calc):
+    # NDJSON ストリーミングの1チャンク分を計算する関数を作成
+    # cls: RCBeam または RCColumn, calc(obj, row): 1部材分の計算 (戻り値 (ma, qa) または None)
+    def calc_chunk(rows):
+        objs = {}  # 材料ごとのインスタンス
+        result = []
+        for row in rows:
+            material = (row.fc, row.bar_main, row.bar_shear, row.bar_cv)
+            if material not in objs:
+                objs[material] = cls(*material)
+            try:
+                values = calc(objs[material], row)
+            except (ArithmeticError, ValueError, TypeError):
+                values = None
+            if values is None:
+                result.append({"error": "計算できない入力がある (断面寸法・配筋を確認してください)"})
+            else:
+                result.append({"Ma": values[0], "Qa": values[1]})
+        return result
+
+    return calc_chunk
+
+
+beam_stream_chunk = rc_stream_chunk(
+    RCBeam,
+    lambda obj, row: obj.calc_beam(
+        row.size, row.bar, row.st, row.load, row.ql_method, row.qs_method, row.alpha
+    ),
+)
+column_stream_chunk = rc_stream_chunk(
+    RCColumn,
+    lambda obj, row: obj.calc_column(
+        row.size, row.bar, row.hoop, row.force, row.load, row.qs_method, row.alpha
+    ),
+)
+
+
+@router.post(
+    "/beam/stream",
+    openapi_extra={
+        "requestBody": {
+            "content": {NDJSON_MEDIA_TYPE: {"schema": RcBeamInput.model_json_schema()}},
+            "required": True,
+        }
+    },
+)
+async def beam_stream(request: Request):
+    """
+    RC梁のリストを NDJSON (1行に1部材のJSON) で受け取り、許容曲げと許容せん断力を NDJSON で順次返します。
+
+    各行の入力は材料 (fc, bar_main, bar_shear, bar_cv) と `RCBeam.calc_beam` の引数です。
+    一定の行数ごとにまとめて計算し、全行の受信を待たずに最初の結果から返します。
+
+    Returns:
+        NDJSON: 1行ごとに `{"index": 行番号, "Ma", "Qa"}`。誤りがある部材は `{"index": 行番号, "error": 内容}`。
+    """
+    return StreamingResponse(stream_rows(request, RcBeamInput, beam_stream_chunk), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.post(
+    "/column/stream",
+    openapi_extra={
+        "requestBody": {
+            "content": {NDJSON_MEDIA_TYPE: {"schema": RcColumnInput.model_json_schema()}},
+            "required": True,
+        }
+    },
+)
+async def column_stream(request: Request):
+    """
+    RC柱のリストを NDJSON (1行に1部材のJSON) で受け取り、許容曲げと許容せん断力を NDJSON で順次返します。
+
+    各行の入力は材料 (fc, bar_main, bar_shear, bar_cv) と `RCColumn.calc_column` の引数です。
+    一定の行数ごとにまとめて計算し、全行の受信を待たずに最初の結果から返します。
+
+    Returns:
+        NDJSON: 1行ごとに `{"index": 行番号, "Ma", "Qa"}`。誤りがある部材は `{"index": 行番号, "error": 内容}`。
+    """
+    return StreamingResponse(
+        stream_rows(request, RcColumnInput, column_stream_chunk), media_type=NDJSON_MEDIA_TYPE
+    )
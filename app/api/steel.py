@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from models.steel_input_models import (
     SteelPostSectionInput,
     HSectionInput,
@@ -6,8 +7,11 @@ from models.steel_input_models import (
     LCSectionInput,
     BOXSectionInput,
     PIPESectionInput,
+    SteelCheckBatchInput,
+    SteelCheckRow,
 )
-from services.steel import Steel
+from services.steel import Steel, section_cache_info
+from services.ndjson_stream import NDJSON_MEDIA_TYPE, stream_rows
 import logging
 
 # ルーターの作成
@@ -435,3 +439,98 @@ def get_pipe_section(
         "ix": values[5],
         "iy": values[6],
     }
+
+
+# 断面キャッシュの利用状況を取得する
+@router.get("/section_cache")
+def get_section_cache():
+    """
+    断面性能のキャッシュ (get_section で共有) の利用状況を取得します。
+
+    Returns:
+        dict: ヒット数 (hits), ミス数 (misses), 最大件数 (maxsize), 現在の件数 (currsize)。
+    """
+    return section_cache_info()
+
+
+def calc_members(members):
+    # SteelCheckRow のリストをまとめて計算 (Steel.calc_batch の戻り値を返す)
+    return Steel().calc_batch(
+        [m.size for m in members],
+        [m.f for m in members],
+        [m.lkx for m in members],
+        [m.lky for m in members],
+        [m.lb for m in members],
+        [m.m2_m1 for m in members],
+    )
+
+
+def steel_stream_chunk(members):
+    # NDJSON ストリーミングの1チャンク分を計算し、部材ごとの結果の辞書のリストを返す
+    result = calc_members(members)
+    errors = result.pop("error")
+    columns = {name: val.tolist() for name, val in result.items()}
+    return [
+        {"error": errors[i]} if i in errors else {name: val[i] for name, val in columns.items()}
+        for i in range(len(members))
+    ]
+
+
+# 部材リストの許容応力度・許容耐力を一括で計算する
+@router.post("/check/batch")
+def check_batch(input_data: SteelCheckBatchInput):
+    """
+    部材リスト (部材寸法, F値, 座屈長さ, 横座屈長さ, M2/M1) の許容応力度と許容耐力を一括で計算します。
+
+    断面性能は同じ部材寸法ごとに1回だけ取得し、座屈・横座屈の計算は配列演算でまとめて行います。
+
+    Returns:
+        dict: 件数 (count), 入力と同じ順の計算結果 (check_result: ft, nt, fc, nc, fb, ma の各リスト),
+            誤りがある部材 (errors: 部材の番号と内容)。誤りがある部材の計算結果は null になります。
+    """
+    members = input_data.members
+    logging.debug(f"Checking {len(members)} steel members")
+
+    result = calc_members(members)
+
+    # 誤りがある部材の計算結果は None とする
+    errors = result.pop("error")
+    check_result = {name: val.tolist() for name, val in result.items()}
+    for i in errors:
+        for val in check_result.values():
+            val[i] = None
+
+    # 件数が多いため jsonable_encoder を経由せずに返す
+    return JSONResponse(
+        content={
+            "count": len(members),
+            "check_result": check_result,
+            "errors": [{"index": i, "detail": detail} for i, detail in errors.items()],
+        }
+    )
+
+
+# 部材リストの許容応力度・許容耐力を NDJSON で順次計算する
+@router.post(
+    "/check/stream",
+    openapi_extra={
+        "requestBody": {
+            "content": {NDJSON_MEDIA_TYPE: {"schema": SteelCheckRow.model_json_schema()}},
+            "required": True,
+        }
+    },
+)
+async def check_stream(request: Request):
+    """
+    部材リストを NDJSON (1行に1部材のJSON) で受け取り、許容応力度と許容耐力を NDJSON で順次返します。
+
+    各行の入力は `/check/batch` の `members` の要素と同じです。一定の行数ごとにまとめて計算し、
+    全行の受信を待たずに最初の結果から返します。
+
+    Returns:
+        NDJSON: 1行ごとに `{"index": 行番号, "ft", "nt", "fc", "nc", "fb", "ma"}`。
+            誤りがある部材は `{"index": 行番号, "error": 内容}`。
+    """
+    return StreamingResponse(
+        stream_rows(request, SteelCheckRow, steel_stream_chunk), media_type=NDJSON_MEDIA_TYPE
+    )
@@ -33,6 +33,9 @@ class Config:
     # 説明文のロード
     APP_DESCRIPTION = load_description()
 
+    # NDJSON ストリーミングで1回にまとめて計算する行数
+    NDJSON_CHUNK_SIZE = int(os.getenv("NDJSON_CHUNK_SIZE", "5000"))
+
     # 環境設定
     ENVIRONMENT = os.getenv("APP_ENV")  # 環境変数で設定する
 
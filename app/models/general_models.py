@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 
 class TypePointInput(BaseModel):
@@ -59,6 +59,74 @@ class TypeTriLeftPartInput(BaseModel):
     wl: Optional[float] = Field(1.5, description="荷重の高さ", json_schema_extra={"example": 1.5})
 
 
+# 一括計算(バッチ)用の入力モデル
+# 各項目は行ごとの値を並べた配列 (列形式), 省略した項目はすべての行で 0 とする
+class CmqBatchInput(BaseModel):
+    type_model: List[str] = Field(
+        ...,
+        description="各行の計算モデルの種類",
+        json_schema_extra={"example": ["type_point", "type_zone", "type_rect_full"]},
+    )
+    al: List[float] = Field(..., description="部材長", json_schema_extra={"example": [6.0, 6.0, 6.0]})
+    a: Optional[List[float]] = Field(
+        None, description="荷重の作用位置・荷重開始位置", json_schema_extra={"example": [3.0, 1.0, 0.0]}
+    )
+    b: Optional[List[float]] = Field(
+        None, description="荷重の作用長さ", json_schema_extra={"example": [0.0, 3.0, 0.0]}
+    )
+    w: Optional[List[float]] = Field(
+        None, description="等分布荷重", json_schema_extra={"example": [0.0, 10.0, 10.0]}
+    )
+    wl: Optional[List[float]] = Field(
+        None, description="荷重の高さ", json_schema_extra={"example": [0.0, 0.0, 1.5]}
+    )
+    p: Optional[List[float]] = Field(
+        None, description="集中荷重", json_schema_extra={"example": [10.0, 0.0, 0.0]}
+    )
+    awl: Optional[List[float]] = Field(
+        None, description="荷重左端の高さ (type_zone)", json_schema_extra={"example": [0.0, 1.5, 0.0]}
+    )
+    bwl: Optional[List[float]] = Field(
+        None, description="荷重右端の高さ (type_zone)", json_schema_extra={"example": [0.0, 0.0, 0.0]}
+    )
+
+
+# 部材ごとの重ね合わせ計算用の荷重の入力モデル
+# 各モデルで使用する項目は type_model_map の入力モデルと同じ (使用しない項目は無視される)
+class CmqLoadInput(BaseModel):
+    type_model: str = Field(..., description="計算モデルの種類", json_schema_extra={"example": "type_point"})
+    a: Optional[float] = Field(0.0, description="荷重の作用位置・荷重開始位置", json_schema_extra={"example": 3.0})
+    b: Optional[float] = Field(0.0, description="荷重の作用長さ", json_schema_extra={"example": 0.0})
+    w: Optional[float] = Field(0.0, description="等分布荷重", json_schema_extra={"example": 0.0})
+    wl: Optional[float] = Field(0.0, description="荷重の高さ", json_schema_extra={"example": 0.0})
+    p: Optional[float] = Field(0.0, description="集中荷重", json_schema_extra={"example": 10.0})
+    awl: Optional[float] = Field(0.0, description="荷重左端の高さ (type_zone)", json_schema_extra={"example": 0.0})
+    bwl: Optional[float] = Field(0.0, description="荷重右端の高さ (type_zone)", json_schema_extra={"example": 0.0})
+
+
+# NDJSON ストリーミング用の1行分の入力モデル (荷重に部材長を加えたもの)
+class CmqStreamRow(CmqLoadInput):
+    al: float = Field(..., description="部材長", json_schema_extra={"example": 6.0})
+
+
+class CmqMemberInput(BaseModel):
+    al: float = Field(6.0, description="部材長", json_schema_extra={"example": 6.0})
+    q_fix: Optional[int] = Field(
+        0, description="0: 両端ピンのせん断力, 1: 両端固定のせん断力", json_schema_extra={"example": 0}
+    )
+    loads: List[CmqLoadInput] = Field(
+        ...,
+        min_length=1,
+        description="部材に作用する荷重のリスト",
+        json_schema_extra={
+            "example": [
+                {"type_model": "type_point", "p": 10.0, "a": 3.0},
+                {"type_model": "type_rect_full", "w": 10.0, "wl": 1.5},
+            ]
+        },
+    )
+
+
 # 入力モデルを辞書で管理
 type_model_map = {
     "type_point": TypePointInput,
@@ -70,3 +138,4 @@ type_model_map = {
     "type_tri_right_part": TypeTriRightPartInput,
     "type_tri_left_part": TypeTriLeftPartInput,
 }
+
@@ -4,3 +4,33 @@ from typing import Optional
 
 class RcGetSectionInput(BaseModel):
     size: Optional[str] = Field("H-300*150*6.5*9", json_schema_extra={"example": "H-300*150*6.5*9"})
+
+
+# RC部材の材料の入力モデル (RCBase の引数と同じ)
+class RcMaterialInput(BaseModel):
+    fc: float = Field(21, json_schema_extra={"example": 24})  # コンクリートの設計強度 (N/mm2)
+    bar_main: str = Field("SD345", json_schema_extra={"example": "SD345"})  # 主筋材料
+    bar_shear: str = Field("SD295", json_schema_extra={"example": "SD295"})  # せん断補強筋材料
+    bar_cv: float = Field(40, json_schema_extra={"example": 40})  # せん断補強筋のかぶり厚 (mm)
+
+
+# RC梁の計算の入力モデル (RCBeam.calc_beam の引数と同じ)
+class RcBeamInput(RcMaterialInput):
+    size: str = Field(..., json_schema_extra={"example": "300*600"})  # 幅 * せい
+    bar: str = Field(..., json_schema_extra={"example": "3/2-3-D25"})  # 主筋本数・径
+    st: str = Field(..., json_schema_extra={"example": "D13@200"})  # スタラップ筋本数・間隔・径
+    load: int = Field(0, ge=0, le=1, json_schema_extra={"example": 1})  # 0:長期, 1:短期
+    ql_method: int = Field(1, json_schema_extra={"example": 1})  # 長期許容せん断力の制御
+    qs_method: int = Field(0, json_schema_extra={"example": 1})  # 短期許容せん断力の制御
+    alpha: float = Field(1, json_schema_extra={"example": 1})  # M/Qdによる割増係数
+
+
+# RC柱の計算の入力モデル (RCColumn.calc_column の引数と同じ)
+class RcColumnInput(RcMaterialInput):
+    size: str = Field(..., json_schema_extra={"example": "600*600"})  # 幅 * せい または 直径
+    bar: str = Field(..., json_schema_extra={"example": "4-D22"})  # 主筋本数・径
+    hoop: str = Field(..., json_schema_extra={"example": "D13@100"})  # HOOP筋本数・間隔・径
+    force: float = Field(0, json_schema_extra={"example": 1350})  # 軸力 (kN)
+    load: int = Field(0, ge=0, le=1, json_schema_extra={"example": 1})  # 0:長期, 1:短期
+    qs_method: int = Field(0, json_schema_extra={"example": 1})  # 短期許容せん断力の制御
+    alpha: float = Field(1, json_schema_extra={"example": 1})  # M/Qdによる割増係数
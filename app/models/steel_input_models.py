@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional, Union
 
 
 class SteelPostSectionInput(BaseModel):
@@ -40,3 +40,18 @@ class BOXSectionInput(BaseModel):
 class PIPESectionInput(BaseModel):
     D: Optional[float] = Field(150, json_schema_extra={"example": 150})  # 外径
     t: Optional[float] = Field(6, json_schema_extra={"example": 6})  # 板厚
+
+
+# 部材検定(一括)の1部材分の入力モデル
+class SteelCheckRow(BaseModel):
+    size: str = Field(..., json_schema_extra={"example": "H-300*150*6.5*9"})  # 部材寸法
+    f: Union[int, str] = Field(0, json_schema_extra={"example": 235})  # F値 (0 の場合は 235)
+    lkx: float = Field(0, json_schema_extra={"example": 3.0})  # 強軸の座屈長さ (m)
+    lky: float = Field(0, json_schema_extra={"example": 0})  # 弱軸の座屈長さ (m) (0 の場合は lkx)
+    lb: float = Field(0, json_schema_extra={"example": 3.0})  # 横座屈長さ (m)
+    m2_m1: float = Field(2, json_schema_extra={"example": 2})  # M2/M1 (|M2/M1| >= 1 の場合は C = 1)
+
+
+# 部材検定(一括)の入力モデル
+class SteelCheckBatchInput(BaseModel):
+    members: List[SteelCheckRow] = Field(..., min_length=1)
@@ -5,6 +5,18 @@
 
 import numpy
 
+# cmq_batch で使用できる計算モデル名
+batch_models = (
+    "type_point",
+    "type_zone",
+    "type_rect_full",
+    "type_rect_part",
+    "type_tri_right_full",
+    "type_tri_left_full",
+    "type_tri_right_part",
+    "type_tri_left_part",
+)
+
 
 class Cmq:
     def __init__(self, q_fix=0):
@@ -91,6 +103,27 @@ class Cmq:
             self.q0_to_qf(al, cmq)
         return cmq
 
+    def cmq_loads(self, al=0, model=(), a=0, b=0, w=0, wl=0, p=0, awl=0, bwl=0):
+        # 1つの部材に作用する種類の異なる複数の荷重による荷重項
+        # al: 部材長
+        # model, a, b, w, wl, p, awl, bwl: 荷重ごとの計算モデル名と入力値の配列 (cmq_batch と同じ)
+        # 戻り値 (Ci, Cj, M0, Qi, Qj)
+        cmq = self.init_cmq()
+        err = ""
+        if al < 0.01:
+            err = "部材長に誤りがある"
+        elif len(model) < 1:
+            err = "荷重の個数に誤りがある"
+        if err:
+            print(err)
+            return cmq
+        # 全荷重をまとめて計算して重ね合わせる
+        cmq += self.cmq_batch(model, al, a, b, w, wl, p, awl, bwl).sum(axis=0)
+        if self.q_fix > 0:
+            # 両端固定梁のせん断力に変換
+            self.q0_to_qf(al, cmq)
+        return cmq
+
     def type_point(self, al, p, a):
         # 集中荷重による荷重項
         # 戻り値 (Ci, Cj, M0, Qi, Qj)
@@ -305,6 +338,182 @@ class Cmq:
             res[2] = 0.1667 * (3 - p1 - p4 + p5) * wa * al
         return res
 
+    def cmq_batch(self, model, al, a=0, b=0, w=0, wl=0, p=0, awl=0, bwl=0):
+        # 複数の荷重項を配列演算でまとめて計算
+        # model: 計算モデル名の配列 ('type_point', 'type_zone' など type_* のメソッド名)
+        # al, a, b, w, wl, p, awl, bwl: 各行の入力値 (配列またはスカラー)
+        #   type_point は p, a を、type_zone は a, b, w, awl, bwl を、
+        #   その他は a, b, w, wl を使用する (使用しない値は無視される)
+        # 戻り値 shape (n, 5) の配列 各行 (Ci, Cj, M0, Qi, Qj)
+        model = numpy.asarray(model)
+        n = len(model)
+        al, a, b, w, wl, p, awl, bwl = (
+            numpy.broadcast_to(numpy.asarray(v, dtype=float), (n,)) for v in (al, a, b, w, wl, p, awl, bwl)
+        )
+        res = numpy.zeros((n, 5))
+        # 使用されない分岐の 0 除算などは結果に影響しないため警告を抑制する
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            for name in batch_models:
+                m = model == name
+                if not m.any():
+                    continue
+                if name == "type_point":
+                    res[m] = self.batch_point(al[m], p[m], a[m])
+                elif name == "type_zone":
+                    res[m] = self.batch_zone(al[m], a[m], b[m], w[m], awl[m], bwl[m])
+                elif name == "type_rect_full":
+                    res[m] = self.batch_rect_full(al[m], w[m], wl[m])
+                elif name == "type_rect_part":
+                    res[m] = self.batch_rect_part(al[m], a[m], b[m], w[m], wl[m])
+                elif name == "type_tri_right_full":
+                    res[m] = self.batch_tri_right_full(al[m], w[m], wl[m])
+                elif name == "type_tri_left_full":
+                    res[m] = self.batch_tri_left_full(al[m], w[m], wl[m])
+                elif name == "type_tri_right_part":
+                    res[m] = self.batch_tri_right_part(al[m], a[m], b[m], w[m], wl[m])
+                else:
+                    res[m] = self.batch_tri_left_part(al[m], a[m], b[m], w[m], wl[m])
+        return res
+
+    # 以下の batch_* は type_* と同じ公式を配列に対して計算するもの
+    # 引数はすべて同じ長さの配列, 戻り値 shape (n, 5) の配列
+
+    def batch_point(self, al, p, a):
+        # 集中荷重による荷重項 (type_point の配列版)
+        b = al - a
+        res = numpy.empty((len(al), 5))
+        res[:, 0] = -p * a * b * b / al / al
+        res[:, 1] = p * a * a * b / al / al
+        res[:, 2] = numpy.where(a < 0.5 * al, 0.5 * p * a, 0.5 * p * b)
+        res[:, 3] = p * b / al
+        res[:, 4] = p * a / al
+        res[a > al] = 0
+        return res
+
+    def batch_zone(self, al, a, b, w, awl, bwl):
+        # 等分布荷重による荷重項 (type_zone の配列版)
+        # 台形・三角形荷重を 等分布 + 右上がり三角形 + 左上がり三角形 の高さに分解して重ね合わせる
+        both = (awl > 0.01) & (bwl > 0.01)
+        flat = numpy.abs(awl - bwl) < 0.01
+        right = bwl > awl
+        # rect_h: 等分布部分の高さ, tri_r_h: 右上がり三角形の高さ, tri_l_h: 左上がり三角形の高さ
+        rect_h = numpy.where(both, numpy.where(flat | right, awl, bwl), 0)
+        tri_r_h = numpy.where(both, numpy.where(~flat & right, bwl - awl, 0), numpy.where(bwl > 0.01, bwl, 0))
+        tri_l_h = numpy.where(
+            both, numpy.where(~flat & ~right, awl - bwl, 0), numpy.where(bwl > 0.01, 0, awl)
+        )
+
+        c = al - a - b
+        full = (a < 0.01) & (c < 0.01)  # 全長にわたる荷重
+        res = numpy.where(
+            full[:, None],
+            self.batch_rect_full(al, w, rect_h)
+            + self.batch_tri_right_full(al, w, tri_r_h)
+            + self.batch_tri_left_full(al, w, tri_l_h),
+            self.batch_rect_part(al, a, b, w, rect_h)
+            + self.batch_tri_right_part(al, a, b, w, tri_r_h)
+            + self.batch_tri_left_part(al, a, b, w, tri_l_h),
+        )
+        res[(b < 0.01) | ((awl < 0.01) & (bwl < 0.01))] = 0
+        return res
+
+    def batch_rect_full(self, al, w, wl):
+        # 部材全長に等分布荷重がある場合 (type_rect_full の配列版)
+        wa = w * wl * al  # 全荷重
+        res = numpy.empty((len(al), 5))
+        res[:, 0] = -0.08333 * wa * al
+        res[:, 1] = -res[:, 0]
+        res[:, 2] = 0.125 * wa * al
+        res[:, 3] = 0.5 * wa
+        res[:, 4] = res[:, 3]
+        return res
+
+    def batch_rect_part(self, al, a, b, w, wl):
+        # 部材中間に等分布荷重がある場合 (type_rect_part の配列版)
+        wa = w * wl * b  # 全荷重
+        r1 = a / al
+        r2 = b / al
+        p1 = 2 * r1 + r2
+        p2 = 3 * (r1**2) + 3 * r1 * r2 + (r2**2)
+        p3 = 4 * (r1**3) + 6 * r2 * (r1**2) + 4 * r1 * (r2**2) + (r2**3)
+        p4 = (1 - 2 * r1) ** 2 / (2 * r2)
+        res = numpy.empty((len(al), 5))
+        res[:, 0] = -0.08333 * (6 * p1 - 8 * p2 + 3 * p3) * wa * al
+        res[:, 1] = 0.08333 * (4 * p2 - 3 * p3) * wa * al
+        res[:, 2] = numpy.select(
+            [(r1 + r2) < 0.5, r1 > 0.5],
+            [0.25 * p1 * wa * al, 0.25 * (2 - p1) * wa * al],
+            0.25 * (2 - p1 - p4) * wa * al,
+        )
+        res[:, 3] = 0.5 * (2 - p1) * wa
+        res[:, 4] = 0.5 * p1 * wa
+        return res
+
+    def batch_tri_right_full(self, al, w, wl):
+        # 部材全長に右上がりの直角三角荷重がある場合 (type_tri_right_full の配列版)
+        wa = 0.5 * w * wl * al  # 全荷重
+        res = numpy.empty((len(al), 5))
+        res[:, 0] = -0.06667 * wa * al
+        res[:, 1] = 0.1 * wa * al
+        res[:, 2] = 0.125 * wa * al
+        res[:, 3] = 0.3333 * wa
+        res[:, 4] = 0.6667 * wa
+        return res
+
+    def batch_tri_left_full(self, al, w, wl):
+        # 部材全長に左上がりの直角三角荷重がある場合 (type_tri_left_full の配列版)
+        wa = 0.5 * w * wl * al  # 全荷重
+        res = numpy.empty((len(al), 5))
+        res[:, 0] = -0.1 * wa * al
+        res[:, 1] = 0.06667 * wa * al
+        res[:, 2] = 0.125 * wa * al
+        res[:, 3] = 0.6667 * wa
+        res[:, 4] = 0.3333 * wa
+        return res
+
+    def batch_tri_right_part(self, al, a, b, w, wl):
+        # 部材中間に右上がりの直角三角荷重がある場合 (type_tri_right_part の配列版)
+        wa = 0.5 * w * wl * b  # 全荷重
+        r1 = a / al
+        r2 = b / al
+        p1 = 3 * r1 + 2 * r2
+        p2 = 6 * (r1**2) + 8 * r1 * r2 + 3 * (r2**2)
+        p3 = 10 * (r1**3) + 20 * r2 * (r1**2) + 15 * r1 * (r2**2) + 4 * (r2**3)
+        p4 = (1 - 2 * r1) ** 3 / (4 * (r2**2))
+        res = numpy.empty((len(al), 5))
+        res[:, 0] = -0.03333 * (10 * p1 - 10 * p2 + 3 * p3) * wa * al
+        res[:, 1] = 0.03333 * (5 * p2 - 3 * p3) * wa * al
+        res[:, 2] = numpy.select(
+            [(r1 + r2) < 0.5, r1 > 0.5],
+            [0.1667 * p1 * wa * al, 0.1667 * (3 - p1) * wa * al],
+            0.1667 * (3 - p1 - p4) * wa * al,
+        )
+        res[:, 3] = 0.3333 * (3 - p1) * wa
+        res[:, 4] = 0.3333 * p1 * wa
+        return res
+
+    def batch_tri_left_part(self, al, a, b, w, wl):
+        # 部材中間に左上がりの直角三角荷重がある場合 (type_tri_left_part の配列版)
+        wa = 0.5 * w * wl * b  # 全荷重
+        r1 = a / al
+        r2 = b / al
+        p1 = 3 * r1 + r2
+        p2 = 6 * (r1**2) + 4 * r1 * r2 + (r2**2)
+        p3 = 10 * (r1**3) + 10 * r2 * (r1**2) + 5 * r1 * (r2**2) + (r2**3)
+        p4 = 1.5 * ((1 - 2 * r1) ** 2) / r2
+        p5 = (1 - 2 * r1) ** 3 / (4 * (r2**2))
+        res = numpy.empty((len(al), 5))
+        res[:, 0] = -0.03333 * (10 * p1 - 10 * p2 + 3 * p3) * wa * al
+        res[:, 1] = 0.03333 * (5 * p2 - 3 * p3) * wa * al
+        res[:, 2] = numpy.select(
+            [(r1 + r2) < 0.5, r1 > 0.5],
+            [0.1667 * p1 * wa * al, 0.1667 * (3 - p1) * wa * al],
+            0.1667 * (3 - p1 - p4 + p5) * wa * al,
+        )
+        res[:, 3] = 0.3333 * (3 - p1) * wa
+        res[:, 4] = 0.3333 * p1 * wa
+        return res
+
     def q0_to_qf(self, al, cmq):
         # 単純梁のせん断力 Q0 を両端固定梁の値に変換
         # al: 部材長
@@ -315,6 +524,13 @@ class Cmq:
         # CMQ用の配列の初期化
         return numpy.zeros(5)
 
+    def batch_form(self, arr, n=2):
+        # cmq_form の配列版 (shape (n, 5) の配列をまとめて整形)
+        # n: 小数以下の桁数
+        if n < 0:
+            return arr
+        return numpy.sign(arr) * (numpy.round((10**n) * numpy.abs(arr)) / (10**n))
+
     def cmq_form(self, arr, n=2):
         # 出力用に値を整形
         # n: 小数以下の桁数
@@ -0,0 +1,74 @@
+import json
+
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from config import config
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def ndjson_line(obj):
+    # 1行分の NDJSON 文字列
+    return json.dumps(obj, ensure_ascii=False) + "\n"
+
+
+async def read_ndjson(request):
+    # リクエストボディを受信した分から1行ずつ読み取る
+    # 戻り値 (空行を除く行番号, 行の辞書) を順に返す, JSONとして読み取れない行は辞書の代わりに None
+    buffer = b""
+    index = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        lines = buffer.split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield (index, parse_line(line))
+                index += 1
+    if buffer.strip():
+        yield (index, parse_line(buffer))
+
+
+def parse_line(line):
+    # 1行分の JSON を辞書に変換, 失敗した場合は None
+    try:
+        row = json.loads(line)
+    except ValueError:
+        return None
+    return row if isinstance(row, dict) else None
+
+
+async def stream_rows(request, model, calc, chunk_size=None):
+    # NDJSON の各行を入力モデル model で検証し、chunk_size 行ごとに calc でまとめて計算して結果を返す
+    # calc(rows): 入力モデルのリストを受け取り、行ごとの結果の辞書のリストを返す関数
+    # 結果は入力と同じ順に {"index": 行番号, ...結果} または {"index": 行番号, "error": 内容} の行で返す
+    if chunk_size is None:
+        chunk_size = config.NDJSON_CHUNK_SIZE
+    chunk = []  # (行番号, 入力モデル または エラー内容)
+    async for index, row in read_ndjson(request):
+        if row is None:
+            chunk.append((index, "JSONの形式に誤りがある"))
+        else:
+            try:
+                chunk.append((index, model.model_validate(row)))
+            except ValidationError as e:
+                chunk.append((index, "入力データが無効です: " + "; ".join(err["msg"] for err in e.errors())))
+        if len(chunk) >= chunk_size:
+            yield await calc_chunk(chunk, calc)
+            chunk = []
+    if chunk:
+        yield await calc_chunk(chunk, calc)
+
+
+async def calc_chunk(chunk, calc):
+    # 1チャンク分を計算して NDJSON の文字列にする (計算はイベントループを止めないよう別スレッドで行う)
+    rows = [row for _, row in chunk if not isinstance(row, str)]
+    results = iter(await run_in_threadpool(calc, rows) if rows else [])
+    lines = []
+    for index, row in chunk:
+        if isinstance(row, str):
+            lines.append(ndjson_line({"index": index, "error": row}))
+        else:
+            lines.append(ndjson_line({"index": index, **next(results)}))
+    return "".join(lines)
@@ -0,0 +1,10 @@
+import pytest
+
+import middleware
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limit():
+    # テストクライアントはすべて同じIPアドレスのため、テストごとにリクエスト回数をリセットする
+    middleware.request_counts.clear()
+    yield
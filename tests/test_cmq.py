@@ -0,0 +1,113 @@
+import json
+import numpy
+from fastapi.testclient import TestClient
+from app.main import app
+from services.cmq import Cmq, batch_models
+
+client = TestClient(app)
+cmq = Cmq()
+
+
+def single_cmq(model, al, a, b, w, wl, p, awl, bwl):
+    # 1行分を type_* で計算した結果
+    if model == "type_point":
+        return cmq.type_point(al, p, a)
+    elif model == "type_zone":
+        return cmq.type_zone(al, a, b, w, awl, bwl)
+    elif model.endswith("_full"):
+        return getattr(cmq, model)(al, w, wl)
+    else:
+        return getattr(cmq, model)(al, a, b, w, wl)
+
+
+def test_cmq_batch_matches_single():
+    rng = numpy.random.default_rng(0)
+    n = 2000
+    model = rng.choice(batch_models, n)
+    al = rng.uniform(1, 10, n)
+    a = numpy.where(rng.random(n) < 0.3, 0, rng.uniform(0, 1, n) * al)
+    b = numpy.where(rng.random(n) < 0.3, al - a, rng.uniform(0, 1, n) * (al - a))
+    w = rng.uniform(-10, 10, n)
+    wl = rng.uniform(0, 3, n)
+    p = rng.uniform(-50, 50, n)
+    awl = rng.choice([0, 0.005, 1.5, 2.5], n)
+    bwl = rng.choice([0, 1.5, 3.0], n)
+
+    expected = numpy.array([single_cmq(*row) for row in zip(model, al, a, b, w, wl, p, awl, bwl)])
+    result = cmq.cmq_batch(model, al, a, b, w, wl, p, awl, bwl)
+    assert numpy.allclose(result, expected, rtol=1e-12, atol=1e-9)
+
+
+def test_cmq_batch_endpoint():
+    response = client.post(
+        "/general/cmq/batch",
+        json={
+            "type_model": ["type_point", "type_rect_full"],
+            "al": [6.0, 6.0],
+            "a": [1.0, 0.0],
+            "p": [10.0, 0.0],
+            "w": [0.0, 10.0],
+            "wl": [0.0, 1.5],
+        },
+    )
+    assert response.status_code == 200
+    result = response.json()["cmq_result"]
+    assert result["Ci"] == [-6.94, -45.0]
+    assert result["Qj"] == [1.67, 45.0]
+
+
+def test_cmq_batch_endpoint_invalid_model():
+    response = client.post("/general/cmq/batch", json={"type_model": ["type_unknown"], "al": [6.0]})
+    assert response.status_code == 400
+
+
+def test_cmq_loads_superposes_and_converts_once():
+    fixed = Cmq(q_fix=1)
+    expected = fixed.init_cmq()
+    expected += fixed.type_zone(6, 1.5, 1.5, 10, 0, 1.5)
+    expected += fixed.type_point(6, 67.5, 3)
+    fixed.q0_to_qf(6, expected)
+
+    result = fixed.cmq_loads(
+        6, ["type_zone", "type_point"], a=[1.5, 3], b=[1.5, 0], w=[10, 0], p=[0, 67.5], bwl=[1.5, 0]
+    )
+    assert numpy.allclose(result, expected)
+
+
+def test_cmq_member_endpoint():
+    response = client.post(
+        "/general/cmq/member",
+        json={
+            "al": 6.0,
+            "q_fix": 1,
+            "loads": [
+                {"type_model": "type_zone", "a": 1.5, "b": 1.5, "w": 10.0, "awl": 0.0, "bwl": 1.5},
+                {"type_model": "type_point", "p": 67.5, "a": 3.0},
+            ],
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["cmq_result"] == {"Ci": -60.01, "Cj": 57.41, "M0": 115.32, "Qi": 40.75, "Qj": 38.0}
+
+
+def test_cmq_stream_endpoint():
+    body = "\n".join(
+        [
+            '{"type_model": "type_point", "al": 6.0, "a": 1.0, "p": 10.0}',
+            "not json",
+            "",
+            '{"type_model": "type_rect_full", "al": 6.0, "w": 10.0, "wl": 1.5}',
+            '{"type_model": "type_unknown", "al": 6.0}',
+        ]
+    )
+    response = client.post(
+        "/general/cmq/stream", content=body, headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["index"] for line in lines] == [0, 1, 2, 3]
+    assert (lines[0]["Ci"], lines[0]["Qj"]) == (-6.94, 1.67)
+    assert "error" in lines[1]
+    assert lines[2]["Ci"] == -45.0
+    assert "error" in lines[3]
@@ -0,0 +1,28 @@
+import json
+from fastapi.testclient import TestClient
+from app.main import app
+from services.rcbeam import RCBeam
+from services.rccolumn import RCColumn
+
+client = TestClient(app)
+
+
+def test_beam_stream_endpoint():
+    rows = [
+        {"fc": 24, "size": "300*600", "bar": "3/2-3-D25", "st": "D13@200", "load": 1, "qs_method": 1},
+        {"size": "300*600", "bar": "3-D99", "st": "D13@200"},
+    ]
+    response = client.post("/rc/beam/stream", content="\n".join(json.dumps(row) for row in rows))
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    ma, qa = RCBeam(fc=24).calc_beam(size="300*600", bar="3/2-3-D25", st="D13@200", load=1, qs_method=1)
+    assert (lines[0]["Ma"], lines[0]["Qa"]) == (ma, qa)
+    assert lines[1] == {"index": 1, "error": lines[1]["error"]}
+
+
+def test_column_stream_endpoint():
+    row = {"size": "600*600", "bar": "4-D22", "hoop": "D13@100", "force": 1350, "load": 1, "qs_method": 1}
+    response = client.post("/rc/column/stream", content=json.dumps(row))
+    assert response.status_code == 200
+    ma, qa = RCColumn().calc_column(**row)
+    assert json.loads(response.text) == {"index": 0, "Ma": ma, "Qa": qa}
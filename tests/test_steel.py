@@ -0,0 +1,97 @@
+import json
+from fastapi.testclient import TestClient
+from app.main import app
+from services.steel import Steel, section_cache_info
+from services.steel_jis import H_SECTIONS, WC_SECTIONS, LC_SECTIONS
+
+client = TestClient(app)
+steel = Steel()
+
+
+def test_jis_tables_are_read_only():
+    for table in (H_SECTIONS, WC_SECTIONS, LC_SECTIONS):
+        assert not table.values.flags.writeable
+        assert len(table.index) == len(table.values)
+
+
+def test_get_section_uses_jis_table():
+    shape, section, values = steel.get_section("H-300*150*6.5*9")
+    assert shape == steel.shape_h
+    assert values == [46.8, 7210, 508, 481, 67.7, 12.4, 3.29]
+
+    shape, section, values = steel.get_section("WC-150*75*9*12.5")
+    assert values == [30.6, 1050, 147, 140, 28.3, 5.86, 2.19, 2.31]
+
+    shape, section, values = steel.get_section("LC-100*50*20*2.3")
+    assert values == [5.172, 80.7, 19.0, 16.1, 6.06, 3.95, 1.92, 1.86]
+
+
+def test_get_section_unregistered():
+    # 未登録のH形鋼は計算値, 未登録の溝形綱は None
+    shape, section, values = steel.get_section("H-301*150*6.5*9")
+    assert values == steel.h_values(section)
+    shape, section, values = steel.get_section("WC-151*75*9*12.5")
+    assert values is None
+
+
+def test_get_section_cache():
+    before = section_cache_info()
+    first = steel.get_section("box-175*9")
+    second = Steel().get_section("BOX-175*9")
+    after = section_cache_info()
+    assert first == second
+    assert after["misses"] == before["misses"] + 1
+    assert after["hits"] == before["hits"] + 1
+
+    # 返されたリストを変更してもキャッシュには影響しない
+    first[2][0] = 0
+    assert steel.get_section("BOX-175*9")[2][0] == second[2][0]
+
+
+def test_get_sections_excel_multi():
+    response = client.get(
+        "/free/get_section/excel/multi",
+        params={"sizes": "H-300*150*6.5*9,WC-151*75*9*12.5", "values": "A,Ix,Cy", "header": True},
+    )
+    assert response.status_code == 200
+    assert response.text.splitlines() == ["A,Ix,Cy", "46.8,7210.0,N/A", "N/A,N/A,N/A"]
+
+
+def test_calc_batch_matches_single():
+    rows = [
+        ("H-300*150*6.5*9", 235, 3.0, 0, 3.0, 2),
+        ("H-300*150*6.5*9", 325, 8.0, 2.0, 6.0, -0.5),
+        ("WC-150*75*9*12.5", "400N", 2.0, 1.0, 1.0, 0.3),
+        ("BOX-150*6", 0, 5.0, 0, 4.0, 2),
+        ("PIPE-150*6", "490N", 0, 0, 0, 2),
+    ]
+    result = steel.calc_batch(*(list(col) for col in zip(*rows)))
+    assert result["error"] == {}
+    for i, (size, f, lkx, lky, lb, m2_m1) in enumerate(rows):
+        assert (result["ft"][i], result["nt"][i]) == steel.calc_ft(size, f)
+        assert (result["fc"][i], result["nc"][i]) == steel.calc_fc(size, lkx, lky, f)
+        assert (result["fb"][i], result["ma"][i]) == steel.calc_fb(size, lb, m2_m1, f)
+
+
+def test_check_batch_endpoint():
+    members = [
+        {"size": "H-300*150*6.5*9", "f": 235, "lkx": 3.0, "lb": 3.0},
+        {"size": "WC-151*75*9*12.5"},
+        {"size": "BOX-150*6", "f": "999X"},
+    ]
+    response = client.post("/steel/check/batch", json={"members": members})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 3
+    assert data["check_result"]["fc"][0] == steel.calc_fc("H-300*150*6.5*9", 3.0, 0, 235)[0]
+    assert data["check_result"]["fb"][1] is None
+    assert [e["index"] for e in data["errors"]] == [1, 2]
+
+
+def test_check_stream_endpoint():
+    body = '{"size": "H-300*150*6.5*9", "lkx": 3.0, "lb": 3.0}\n{"size": "X-1"}\n{"lkx": 1.0}\n'
+    response = client.post("/steel/check/stream", content=body)
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0]["fb"] == steel.calc_fb("H-300*150*6.5*9", 3.0)[0]
+    assert "error" in lines[1] and "error" in lines[2]